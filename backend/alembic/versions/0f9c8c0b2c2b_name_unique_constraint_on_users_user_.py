@@ -0,0 +1,34 @@
+"""Name unique constraint on users.user_identifier
+
+Revision ID: 0f9c8c0b2c2b
+Revises: 3bc22a226ccd
+Create Date: 2026-10-15 11:26:05.918342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f9c8c0b2c2b'
+down_revision: Union[str, Sequence[str], None] = '3bc22a226ccd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The initial schema already created an (unnamed) unique constraint, and
+    # with it a unique B-tree index. Give it the name the model declares.
+    op.execute(
+        "ALTER TABLE users RENAME CONSTRAINT users_user_identifier_key TO uq_users_user_identifier"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "ALTER TABLE users RENAME CONSTRAINT uq_users_user_identifier TO users_user_identifier_key"
+    )
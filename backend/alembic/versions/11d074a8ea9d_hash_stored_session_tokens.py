@@ -0,0 +1,80 @@
+"""Hash stored session tokens
+
+Revision ID: 11d074a8ea9d
+Revises: 0f9c8c0b2c2b
+Create Date: 2026-10-15 13:41:52.377106
+
+"""
+from typing import Sequence, Union
+import hashlib
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '11d074a8ea9d'
+down_revision: Union[str, Sequence[str], None] = '0f9c8c0b2c2b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Rows read and rewritten per round
+BATCH_SIZE = 10000
+
+
+def _hash_session_token(session_token: str, key: bytes) -> str:
+    # Frozen copy of routers.auth.hash_session_token; SESSION_TOKEN_SECRET
+    # must match the value the application runs with
+    return hashlib.blake2b(
+        session_token.encode(),
+        digest_size=16,
+        key=key
+    ).hexdigest()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    key = os.getenv("SESSION_TOKEN_SECRET", "").encode()
+    if not key:
+        raise ValueError("SESSION_TOKEN_SECRET environment variable is required")
+    if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+        raise ValueError(f"SESSION_TOKEN_SECRET must be at most {hashlib.blake2b.MAX_KEY_SIZE} bytes")
+
+    # Replace raw tokens with their digests so existing sessions stay valid
+    connection = op.get_bind()
+    sessions = sa.table(
+        'sessions',
+        sa.column('id', sa.UUID()),
+        sa.column('session_token', sa.String(length=255))
+    )
+    update_token = (
+        sessions.update()
+        .where(sessions.c.id == sa.bindparam('b_id'))
+        .values(session_token=sa.bindparam('b_session_token'))
+    )
+    # Keyset reads on id keep only one batch in memory at a time
+    select_batch = (
+        sa.select(sessions.c.id, sessions.c.session_token)
+        .order_by(sessions.c.id)
+        .limit(BATCH_SIZE)
+    )
+    last_id = None
+    while True:
+        rows = connection.execute(
+            select_batch if last_id is None else select_batch.where(sessions.c.id > last_id)
+        ).all()
+        if not rows:
+            break
+        connection.execute(update_token, [
+            {'b_id': row.id, 'b_session_token': _hash_session_token(row.session_token, key)}
+            for row in rows
+        ])
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw tokens cannot be recovered from their digests; drop all sessions
+    op.execute("DELETE FROM sessions")
@@ -0,0 +1,41 @@
+"""Add index on sessions.expires_at
+
+Revision ID: 3a7067e17b7d
+Revises: bc386bcb6475
+Create Date: 2026-10-15 09:12:31.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7067e17b7d'
+down_revision: Union[str, Sequence[str], None] = 'bc386bcb6475'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the index without blocking writes to the sessions table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_sessions_expires_at'),
+            'sessions',
+            ['expires_at'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_sessions_expires_at'),
+            table_name='sessions',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,43 @@
+"""Add composite index for Task1 archive queries
+
+Revision ID: 3bc22a226ccd
+Revises: 3a7067e17b7d
+Create Date: 2026-10-15 10:03:47.561920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3bc22a226ccd'
+down_revision: Union[str, Sequence[str], None] = '3a7067e17b7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (user_id, task_type, created_at DESC, id DESC) lets the archive listing,
+    # its (created_at, id) keyset cursor and its count be served from a
+    # single index range without a Sort node
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ps_user_task_created',
+            'practice_sessions',
+            ['user_id', 'task_type', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_ps_user_task_created',
+            table_name='practice_sessions',
+            postgresql_concurrently=True
+        )
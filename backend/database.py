@@ -2,7 +2,11 @@
 Database configuration and session management.
 """
 import os
+import ssl
+from typing import Any, Dict, Mapping, Tuple, Union
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 
@@ -11,16 +15,154 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://localhost:5432/toefl_speaking_dev")
 
+# Async drivers for each supported backend
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+# libpq-only SSL file parameters, translated into an ssl.SSLContext for asyncpg
+LIBPQ_SSL_FILE_PARAMS = ("sslrootcert", "sslcert", "sslkey", "sslcrl")
+
+# libpq connection parameters that asyncpg.connect() does not accept. Hosted
+# PostgreSQL URLs (e.g. Neon) typically carry sslmode/channel_binding.
+# channel_binding is dropped: asyncpg authenticates with plain SCRAM, which
+# such servers also accept.
+LIBPQ_ONLY_PARAMS = (
+    "sslmode",
+    "channel_binding",
+    "gssencmode",
+    "connect_timeout",
+) + LIBPQ_SSL_FILE_PARAMS
+
+
+def _asyncpg_ssl(query: Mapping[str, Any]) -> Union[str, ssl.SSLContext, None]:
+    """
+    Translate libpq SSL query parameters into asyncpg's ssl connect argument.
+
+    Without certificate/CRL files the libpq sslmode name is passed through,
+    which asyncpg accepts directly. With files, an SSLContext is built that
+    follows libpq semantics: verify-full checks the hostname, verify-ca (or
+    require with a root certificate) checks the chain only.
+
+    Args:
+        query: Query parameters of the database URL
+
+    Returns:
+        asyncpg ssl argument, or None to use asyncpg's default
+    """
+    sslmode = query.get("sslmode")
+    rootcert, cert, key, crl = (query.get(name) for name in LIBPQ_SSL_FILE_PARAMS)
+    if not (rootcert or cert or crl) or sslmode == "disable":
+        return sslmode
+
+    context = ssl.create_default_context(cafile=rootcert)
+    verify = sslmode in ("verify-ca", "verify-full") or (sslmode == "require" and rootcert)
+    context.check_hostname = sslmode == "verify-full"
+    context.verify_mode = ssl.CERT_REQUIRED if verify else ssl.CERT_NONE
+    if crl:
+        context.load_verify_locations(cafile=crl)
+        context.verify_flags |= ssl.VERIFY_CRL_CHECK_LEAF
+    if cert:
+        context.load_cert_chain(cert, keyfile=key)
+    return context
+
+
+def to_async_url(database_url: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Rewrite a sync database URL to use the matching async driver.
+
+    For PostgreSQL, libpq-only query parameters are stripped from the URL
+    and translated to asyncpg connect arguments: SSL settings to ssl and
+    connect_timeout to timeout.
+
+    Args:
+        database_url: Sync SQLAlchemy database URL
+
+    Returns:
+        Tuple of (async database URL, extra connect_args for the async engine)
+
+    Raises:
+        ValueError: If the URL requires a feature asyncpg does not support
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    async_driver = ASYNC_DRIVERS.get(backend)
+    if async_driver is None:
+        return database_url, {}
+
+    connect_args: Dict[str, Any] = {}
+    if backend == "postgresql":
+        if url.query.get("gssencmode") == "require":
+            raise ValueError("gssencmode=require is not supported by the asyncpg driver")
+
+        ssl_arg = _asyncpg_ssl(url.query)
+        if ssl_arg is not None:
+            connect_args["ssl"] = ssl_arg
+        if url.query.get("connect_timeout"):
+            connect_args["timeout"] = float(url.query["connect_timeout"])
+        url = url.difference_update_query(LIBPQ_ONLY_PARAMS)
+
+    return url.set(drivername=async_driver).render_as_string(hide_password=False), connect_args
+
+
+# Connection pool settings. Each worker holds two pools (sync and async
+# engine), so keep
+#   workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW
+#              + DB_ASYNC_POOL_SIZE + DB_ASYNC_MAX_OVERFLOW) < PostgreSQL max_connections
+# across all application instances.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_ASYNC_POOL_SIZE = int(os.getenv("DB_ASYNC_POOL_SIZE", "5"))
+DB_ASYNC_MAX_OVERFLOW = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "5"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+
+POOL_OPTIONS = {
+    "pool_pre_ping": True,
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_use_lifo": True,
+}
+
+_is_postgresql = make_url(DATABASE_URL).get_backend_name() == "postgresql"
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    connect_args=(
+        {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"} if _is_postgresql else {}
+    ),
+    **POOL_OPTIONS
 )
 
-# Create session factory
+# Async engine for routes that run on AsyncSession
+ASYNC_DATABASE_URL, _async_connect_args = to_async_url(DATABASE_URL)
+if _is_postgresql:
+    _async_connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args=_async_connect_args,
+    **{
+        **POOL_OPTIONS,
+        "pool_size": DB_ASYNC_POOL_SIZE,
+        "max_overflow": DB_ASYNC_MAX_OVERFLOW,
+    }
+)
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 
 def get_db():
@@ -30,3 +172,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency for getting an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
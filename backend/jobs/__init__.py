@@ -0,0 +1,16 @@
+"""
+Background maintenance jobs for TOEFL Speaking Master API.
+"""
+from .cleanup_sessions import (
+    cleanup_expired_sessions,
+    maybe_cleanup_expired_sessions,
+    run_periodic_session_cleanup,
+    run_session_cleanup
+)
+
+__all__ = [
+    "cleanup_expired_sessions",
+    "maybe_cleanup_expired_sessions",
+    "run_periodic_session_cleanup",
+    "run_session_cleanup"
+]
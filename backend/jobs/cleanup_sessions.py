@@ -0,0 +1,231 @@
+"""
+Expired session cleanup job for TOEFL Speaking Master API.
+Removes expired rows from the sessions table out-of-band so the
+request path never has to write when it encounters an expired token.
+"""
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import Session as DBSession
+
+
+logger = logging.getLogger(__name__)
+
+# Rows deleted per transaction, and pause between batches so replicas can catch up
+SESSION_CLEANUP_BATCH_SIZE = int(os.getenv("SESSION_CLEANUP_BATCH_SIZE", "5000"))
+SESSION_CLEANUP_BATCH_PAUSE_SECONDS = float(os.getenv("SESSION_CLEANUP_BATCH_PAUSE_SECONDS", "0.05"))
+SESSION_CLEANUP_INTERVAL_SECONDS = int(os.getenv("SESSION_CLEANUP_INTERVAL_SECONDS", "3600"))
+
+# Fallback sweep triggered from the request path in case the scheduler is down
+FALLBACK_CLEANUP_PROBABILITY = 0.01
+FALLBACK_CLEANUP_BATCH_SIZE = 100
+
+# pg_advisory_lock key held for the duration of a full sweep, so workers and
+# cron runs never execute the batch delete loop concurrently
+SESSION_CLEANUP_LOCK_KEY = 0x5E55C1EA
+
+
+# PostgreSQL has no DELETE ... LIMIT; address the batch by physical row id
+# so each chunk is a bounded scan of the expires_at index plus a TID lookup
+_POSTGRESQL_DELETE_EXPIRED_BATCH = text(
+    "DELETE FROM sessions WHERE ctid IN ("
+    "SELECT ctid FROM sessions WHERE expires_at < :now LIMIT :batch_size"
+    ")"
+)
+
+
+def _delete_expired_batch(db: Session, batch_size: int) -> int:
+    """
+    Delete one batch of expired sessions and commit.
+    
+    Each batch is its own short transaction, so row locks are held only
+    for the duration of one chunk.
+    
+    Args:
+        db: Database session
+        batch_size: Maximum number of rows to delete
+        
+    Returns:
+        Number of rows deleted
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        result = db.execute(
+            _POSTGRESQL_DELETE_EXPIRED_BATCH,
+            {"now": datetime.utcnow(), "batch_size": batch_size}
+        )
+        db.commit()
+        return result.rowcount
+    
+    expired_ids = (
+        select(DBSession.id)
+        .where(DBSession.expires_at < datetime.utcnow())
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    result = db.execute(
+        delete(DBSession)
+        .where(DBSession.id.in_(expired_ids))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def cleanup_expired_sessions(
+    db: Session,
+    batch_size: int = SESSION_CLEANUP_BATCH_SIZE,
+    pause_seconds: float = SESSION_CLEANUP_BATCH_PAUSE_SECONDS,
+    stop_event: Optional[threading.Event] = None
+) -> int:
+    """
+    Delete all expired sessions in bounded batches until none remain.
+    
+    Args:
+        db: Database session
+        batch_size: Maximum number of rows to delete per batch
+        pause_seconds: Time to sleep between full batches
+        stop_event: When set, stop after the current batch
+        
+    Returns:
+        Total number of sessions deleted
+    """
+    total_deleted = 0
+    while True:
+        deleted = _delete_expired_batch(db, batch_size)
+        total_deleted += deleted
+        if deleted < batch_size or (stop_event is not None and stop_event.is_set()):
+            break
+        time.sleep(pause_seconds)
+    
+    logger.info(f"Deleted {total_deleted} expired sessions")
+    return total_deleted
+
+
+def maybe_cleanup_expired_sessions(db: Session) -> int:
+    """
+    Probabilistically delete a small batch of expired sessions.
+    
+    Bounds table growth if the periodic job is not running. Only a
+    small fraction of calls actually touch the database.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Number of sessions deleted
+    """
+    if random.random() >= FALLBACK_CLEANUP_PROBABILITY:
+        return 0
+    
+    try:
+        return _delete_expired_batch(db, FALLBACK_CLEANUP_BATCH_SIZE)
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Fallback session cleanup failed: {e}")
+        return 0
+
+
+@contextmanager
+def _cleanup_lock(bind: Engine) -> Iterator[bool]:
+    """
+    Try to take the cross-process session cleanup lock.
+    
+    On PostgreSQL this is a session-level advisory lock held on a dedicated
+    connection for the duration of the sweep; it is released explicitly,
+    or by the server if the connection drops. Other backends have no
+    multi-process deployment and always acquire.
+    
+    Args:
+        bind: Engine the sweep runs against
+        
+    Yields:
+        Whether the lock was acquired
+    """
+    if bind.dialect.name != "postgresql":
+        yield True
+        return
+    
+    with bind.connect() as connection:
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(:key)"),
+            {"key": SESSION_CLEANUP_LOCK_KEY}
+        ).scalar()
+        # End the transaction; the session-level lock outlives it
+        connection.commit()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": SESSION_CLEANUP_LOCK_KEY}
+                )
+                connection.commit()
+
+
+def run_session_cleanup(stop_event: Optional[threading.Event] = None) -> Optional[int]:
+    """
+    Run one full sweep unless another process is already sweeping.
+    
+    Args:
+        stop_event: When set, stop after the current batch
+        
+    Returns:
+        Number of sessions deleted, or None if the sweep was skipped
+    """
+    db = SessionLocal()
+    try:
+        with _cleanup_lock(db.get_bind()) as acquired:
+            if not acquired:
+                logger.info("Session cleanup already running in another process, skipping")
+                return None
+            return cleanup_expired_sessions(db, stop_event=stop_event)
+    finally:
+        db.close()
+
+
+async def run_periodic_session_cleanup(interval_seconds: int = SESSION_CLEANUP_INTERVAL_SECONDS):
+    """
+    Run expired session cleanup forever at a fixed interval.
+    
+    The blocking database work runs in a worker thread so the event
+    loop is not stalled. The first sweep is delayed by a random fraction
+    of the interval so workers started together do not all sweep at boot.
+    When cancelled, an in-flight sweep is asked to stop after its current
+    batch and awaited before the cancellation propagates.
+    
+    Args:
+        interval_seconds: Seconds to wait between sweeps
+    """
+    stop_event = threading.Event()
+    await asyncio.sleep(random.uniform(0, interval_seconds))
+    
+    while True:
+        sweep = asyncio.ensure_future(asyncio.to_thread(run_session_cleanup, stop_event))
+        try:
+            await asyncio.shield(sweep)
+        except asyncio.CancelledError:
+            stop_event.set()
+            await asyncio.gather(sweep, return_exceptions=True)
+            raise
+        except Exception as e:
+            logger.error(f"Session cleanup job failed: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+if __name__ == "__main__":
+    # Allow running a single sweep from cron: python -m jobs.cleanup_sessions
+    logging.basicConfig(level=logging.INFO)
+    run_session_cleanup()
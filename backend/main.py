@@ -1,6 +1,9 @@
 """
 FastAPI main application entry point for TOEFL Speaking Master.
 """
+import asyncio
+import hashlib
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -25,17 +28,42 @@ from middleware import (
 # Import exceptions
 from exceptions import TOEFLAppException
 
+# Import background jobs
+from jobs import run_periodic_session_cleanup
+
+# Import services
+from services.redis_client import close_redis_client
+from services.session_cache import get_session_cache
+
 # Load environment variables first
 load_dotenv()
 
 # Verify critical environment variables
 if not os.getenv("OPENAI_API_KEY") and not os.getenv("AZURE_OPENAI_API_KEY"):
     raise ValueError("OPENAI_API_KEY or AZURE_OPENAI_API_KEY environment variable is required")
+if not os.getenv("SESSION_TOKEN_SECRET"):
+    raise ValueError("SESSION_TOKEN_SECRET environment variable is required")
+if len(os.getenv("SESSION_TOKEN_SECRET").encode()) > hashlib.blake2b.MAX_KEY_SIZE:
+    raise ValueError(f"SESSION_TOKEN_SECRET must be at most {hashlib.blake2b.MAX_KEY_SIZE} bytes (BLAKE2b key limit)")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background maintenance jobs and release shared clients on shutdown."""
+    cleanup_task = asyncio.create_task(run_periodic_session_cleanup())
+    yield
+    # Cancellation lets an in-flight sweep finish its current batch first
+    cleanup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await cleanup_task
+    await close_redis_client()
+
 
 app = FastAPI(
     title="TOEFL Speaking Master API",
     description="API for TOEFL iBT Speaking Task 3 practice application",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Register global exception handlers
@@ -96,7 +124,8 @@ async def health_check():
     return {
         "status": "healthy",
         "database": "connected",
-        "api_version": "1.0.0"
+        "api_version": "1.0.0",
+        "session_cache": get_session_cache().stats()
     }
 
 
@@ -3,7 +3,7 @@ SQLAlchemy database models for TOEFL Speaking Master application.
 """
 from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, CheckConstraint, JSON
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, CheckConstraint, JSON, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -30,10 +30,15 @@ class User(Base):
     __tablename__ = "users"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_identifier = Column(String(255), unique=True, nullable=False)
+    user_identifier = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    # Backs user lookups by identifier and the ON CONFLICT upsert at login
+    __table_args__ = (
+        UniqueConstraint("user_identifier", name="uq_users_user_identifier"),
+    )
+
     # Relationships
     practice_sessions = relationship("PracticeSession", back_populates="user", cascade="all, delete-orphan")
     saved_phrases = relationship("SavedPhrase", back_populates="user", cascade="all, delete-orphan")
@@ -62,6 +67,12 @@ class PracticeSession(Base):
     model_answer = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Serves per-user, per-task listings ordered by most recent first, with
+    # id as the tiebreaker used by the archive's (created_at, id) keyset cursor
+    __table_args__ = (
+        Index("ix_ps_user_task_created", user_id, task_type, created_at.desc(), id.desc()),
+    )
+
     # Relationships
     user = relationship("User", back_populates="practice_sessions")
 
@@ -95,7 +106,7 @@ class Session(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     session_token = Column(String(255), unique=True, nullable=False, index=True)
-    expires_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
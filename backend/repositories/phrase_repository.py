@@ -1,14 +1,25 @@
 """
 Repository for SavedPhrase CRUD operations.
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from models import SavedPhrase, User
 
 
+# Maximum number of rows sent per executemany/commit in bulk operations
+BULK_BATCH_SIZE = 10000
+
+
 class PhraseRepository:
-    """Repository for managing saved phrases."""
+    """
+    Repository for managing saved phrases.
+    
+    Mutation methods do not commit. The caller owns the unit of work and
+    commits once after all of its changes, so several mutations share a
+    single transaction.
+    """
     
     def __init__(self, db: Session):
         """
@@ -36,7 +47,7 @@ class PhraseRepository:
             category: Category of the phrase (e.g., 'transition', 'example', 'conclusion')
         
         Returns:
-            The saved SavedPhrase object
+            The saved SavedPhrase object (flushed, so id and created_at are set)
         """
         saved_phrase = SavedPhrase(
             user_id=user_id,
@@ -46,10 +57,26 @@ class PhraseRepository:
             is_mastered=False
         )
         self.db.add(saved_phrase)
-        self.db.commit()
-        self.db.refresh(saved_phrase)
+        self.db.flush()
         return saved_phrase
     
+    def save_phrases_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Save many phrases using batched executemany inserts.
+        
+        Rows are sent in batches of up to BULK_BATCH_SIZE, instead of one
+        INSERT per phrase.
+        
+        Args:
+            rows: Column mappings with user_id, phrase, context and category
+        
+        Returns:
+            Number of phrases inserted
+        """
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            self.db.execute(insert(SavedPhrase), rows[start:start + BULK_BATCH_SIZE])
+        return len(rows)
+    
     def get_phrase(self, phrase_id: UUID) -> Optional[SavedPhrase]:
         """
         Get a phrase by ID.
@@ -60,7 +87,7 @@ class PhraseRepository:
         Returns:
             SavedPhrase object or None if not found
         """
-        return self.db.query(SavedPhrase).filter(SavedPhrase.id == phrase_id).first()
+        return self.db.get(SavedPhrase, phrase_id)
     
     def get_user_phrases(self, user_id: UUID) -> List[SavedPhrase]:
         """
@@ -83,6 +110,8 @@ class PhraseRepository:
         """
         Delete a phrase by ID.
         
+        The row is removed when the caller's transaction is flushed.
+        
         Args:
             phrase_id: UUID of the phrase to delete
         
@@ -92,7 +121,6 @@ class PhraseRepository:
         phrase = self.get_phrase(phrase_id)
         if phrase:
             self.db.delete(phrase)
-            self.db.commit()
             return True
         return False
     
@@ -110,7 +138,5 @@ class PhraseRepository:
         phrase = self.get_phrase(phrase_id)
         if phrase:
             phrase.is_mastered = is_mastered
-            self.db.commit()
-            self.db.refresh(phrase)
             return phrase
         return None
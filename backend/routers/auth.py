@@ -1,19 +1,50 @@
 """
 Authentication router for simple login functionality.
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import bindparam, delete, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from pydantic import BaseModel
 from datetime import datetime, timedelta
+import hashlib
+import logging
+import os
+import re
 import secrets
 from typing import Optional
 from uuid import UUID
 
-from database import get_db
+from database import get_async_db
 from models import User, Session as DBSession # Renamed to avoid conflict with sqlalchemy.orm.Session
+from services.session_cache import get_session_cache
+from jobs.cleanup_sessions import maybe_cleanup_expired_sessions
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
+# Sessions last 30 days and are extended only once fewer than 7 days remain,
+# so the common request path never writes
+SESSION_LIFETIME = timedelta(days=30)
+SESSION_REFRESH_THRESHOLD = timedelta(days=7)
+
+# Tokens from generate_session_token(): 32 random bytes, urlsafe base64 without padding
+SESSION_TOKEN_RE = re.compile(r"\A[A-Za-z0-9_-]{43}\Z")
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+# Hot-path lookup compiled once and reused from SQLAlchemy's statement cache
+_select_session_by_token = lambda_stmt(
+    lambda: select(DBSession).where(DBSession.session_token == bindparam("token_key"))
+)
+
+# Key for hashing session tokens before they are stored or looked up
+# (required, at most 64 bytes; main.py refuses to start otherwise)
+SESSION_TOKEN_SECRET = os.getenv("SESSION_TOKEN_SECRET", "").encode()
+
 
 class SimpleLoginRequest(BaseModel):
     """Request model for simple login."""
@@ -31,23 +62,50 @@ def generate_session_token() -> str:
     return secrets.token_urlsafe(32)
 
 
-def create_or_get_user(db: Session, user_identifier: str) -> User:
-    """Create a new user or get existing user by identifier."""
-    user = db.query(User).filter(User.user_identifier == user_identifier).first()
+def hash_session_token(session_token: str) -> str:
+    """
+    Derive the storage key for a session token.
     
-    if not user:
-        user = User(user_identifier=user_identifier)
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+    Only this 16-byte keyed BLAKE2b digest (32 hex chars) is stored in the
+    database and the cache; the raw token exists only on the client. This
+    keeps index entries and cache keys small, and a leaked sessions table
+    cannot be replayed as bearer tokens.
+    """
+    return hashlib.blake2b(
+        session_token.encode(),
+        digest_size=16,
+        key=SESSION_TOKEN_SECRET
+    ).hexdigest()
+
+
+async def create_or_get_user(db: AsyncSession, user_identifier: str) -> UUID:
+    """
+    Create a new user or get existing user by identifier.
     
-    return user
+    Issues a single INSERT ... ON CONFLICT DO UPDATE ... RETURNING id, which is
+    also safe against concurrent logins for the same identifier. Does not
+    commit; the caller owns the transaction.
+    
+    Returns:
+        UUID of the user
+    """
+    insert = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = (
+        insert(User)
+        .values(user_identifier=user_identifier)
+        .on_conflict_do_update(
+            index_elements=[User.user_identifier],
+            set_={"user_identifier": user_identifier}
+        )
+        .returning(User.id)
+    )
+    return (await db.execute(stmt)).scalar_one()
 
 
 @router.post("/simple-login", response_model=SimpleLoginResponse)
 async def simple_login(
     request: SimpleLoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Simple login endpoint that creates or retrieves a user and generates a session token.
@@ -55,72 +113,148 @@ async def simple_login(
     Requirements: 1.1, 1.2
     """
     try:
-        # Create or get user
-        user = create_or_get_user(db, request.user_id)
+        # Create or get user (committed together with the session below)
+        user_id = await create_or_get_user(db, request.user_id)
         
         # Generate session token
         session_token = generate_session_token()
-        expires_at = datetime.utcnow() + timedelta(days=30) # Session expires in 30 days
+        token_key = hash_session_token(session_token)
+        expires_at = datetime.utcnow() + SESSION_LIFETIME
         
         # Store session in database
         db_session = DBSession(
-            user_id=user.id,
-            session_token=session_token,
+            user_id=user_id,
+            session_token=token_key,
             expires_at=expires_at
         )
         db.add(db_session)
-        db.commit()
-        db.refresh(db_session)
+        await db.commit()
+        
+        # Cache session so subsequent lookups skip the database
+        session_cache = get_session_cache()
+        await session_cache.set_session(token_key, user_id, request.user_id, expires_at)
+        
+        # Fallback sweep in case the periodic cleanup job is not running
+        await db.run_sync(maybe_cleanup_expired_sessions)
         
         return SimpleLoginResponse(
             session_token=session_token,
-            user_id=str(user.id)
+            user_id=str(user_id)
         )
     
     except Exception as e:
-        db.rollback() # Rollback in case of error
+        await db.rollback() # Rollback in case of error
         raise HTTPException(status_code=500, detail=f"Login failed: {str(e)}")
 
 
-def get_current_user(
-    session_token: Optional[str] = None,
-    db: Session = Depends(get_db)
+async def extend_session(db: AsyncSession, token_key: str) -> Optional[datetime]:
+    """
+    Push a session's expiration out to a full SESSION_LIFETIME from now.
+    
+    Args:
+        db: Database session
+        token_key: Hashed session token (see hash_session_token)
+    
+    Returns:
+        The new expiration time, or None if the session no longer exists
+    """
+    expires_at = datetime.utcnow() + SESSION_LIFETIME
+    result = await db.execute(
+        update(DBSession)
+        .where(DBSession.session_token == token_key)
+        .values(expires_at=expires_at)
+    )
+    await db.commit()
+    return expires_at if result.rowcount else None
+
+
+def get_session_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    session_token: Optional[str] = Query(
+        None,
+        description="Session token (deprecated; send an Authorization: Bearer header instead)"
+    )
+) -> Optional[str]:
+    """
+    Dependency to read the session token from the request.
+    
+    Prefers the Authorization: Bearer header and falls back to the
+    session_token query parameter. Tokens that cannot have been issued by
+    generate_session_token() are rejected before any cache or database lookup.
+    """
+    token = credentials.credentials if credentials else session_token
+    if not token or not SESSION_TOKEN_RE.match(token):
+        return None
+    return token
+
+
+async def get_current_user(
+    session_token: Optional[str] = Depends(get_session_token),
+    db: AsyncSession = Depends(get_async_db)
 ) -> Optional[User]:
     """
     Dependency to get current user from session token.
-    Fetches session from database and checks for expiration.
-    Deletes expired sessions.
+    Resolves the session and its user entirely from the Redis cache when
+    possible (no database access), otherwise
+    fetches it from the database, checks for expiration and populates the cache.
+    Expired sessions are treated as absent; they are removed by the
+    periodic cleanup job (see jobs/cleanup_sessions.py). Sessions with
+    less than SESSION_REFRESH_THRESHOLD remaining are extended.
     """
     if not session_token:
         return None
     
-    db_session = db.query(DBSession).filter(DBSession.session_token == session_token).first()
+    token_key = hash_session_token(session_token)
+    session_cache = get_session_cache()
+    
+    # Fast path: resolve token and user from cache
+    cached_session = await session_cache.get_session(token_key)
+    if cached_session:
+        user_id, user_identifier, expires_at = cached_session
+        now = datetime.utcnow()
+        if expires_at < now:
+            return None
+        
+        if expires_at - now < SESSION_REFRESH_THRESHOLD:
+            expires_at = await extend_session(db, token_key)
+            if expires_at is None:
+                await session_cache.delete_session(token_key)
+                return None
+            await session_cache.set_session(token_key, user_id, user_identifier, expires_at)
+        
+        # Detached user built from the cached fields
+        return User(id=user_id, user_identifier=user_identifier)
+    
+    db_session = await db.scalar(_select_session_by_token, {"token_key": token_key})
     
     if not db_session:
         return None
     
     # Check if session expired
-    if db_session.expires_at < datetime.utcnow():
-        db.delete(db_session)
-        db.commit()
+    now = datetime.utcnow()
+    expires_at = db_session.expires_at
+    if expires_at < now:
         return None
     
+    if expires_at - now < SESSION_REFRESH_THRESHOLD:
+        expires_at = await extend_session(db, token_key) or expires_at
+    
     # Get user from database
-    user = db.query(User).filter(User.id == db_session.user_id).first()
+    user = await db.get(User, db_session.user_id)
+    
+    if user:
+        await session_cache.set_session(token_key, user.id, user.user_identifier, expires_at)
     
     return user
 
 
 @router.get("/verify")
 async def verify_session(
-    session_token: str,
-    db: Session = Depends(get_db)
+    user: Optional[User] = Depends(get_current_user)
 ):
     """
     Verify if a session token is valid.
     """
-    user = get_current_user(session_token, db)
-    
     if not user:
         raise HTTPException(status_code=401, detail="Invalid or expired session")
     
@@ -132,16 +266,21 @@ async def verify_session(
 
 @router.post("/logout")
 async def logout(
-    session_token: str,
-    db: Session = Depends(get_db)
+    session_token: Optional[str] = Depends(get_session_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Logs out a user by deleting their session token from the database.
-    """
-    db_session = db.query(DBSession).filter(DBSession.session_token == session_token).first()
     
-    if db_session:
-        db.delete(db_session)
-        db.commit()
+    Issues a single DELETE without looking the session up first; deleting
+    a missing or expired session is a no-op.
+    """
+    if session_token:
+        token_key = hash_session_token(session_token)
+        await db.execute(
+            delete(DBSession).where(DBSession.session_token == token_key)
+        )
+        await db.commit()
+        await get_session_cache().delete_session(token_key)
     
     return {"message": "Logged out successfully"}
\ No newline at end of file
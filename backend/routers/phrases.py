@@ -136,11 +136,14 @@ async def save_phrase(
         category=request.category
     )
     
-    return PhraseSaveResponse(
+    response = PhraseSaveResponse(
         phrase_id=str(saved_phrase.id),
         created_at=saved_phrase.created_at,
         message="フレーズが保存されました"
     )
+    db.commit()
+    
+    return response
 
 
 @router.get("", response_model=PhrasesListResponse)
@@ -203,6 +206,7 @@ async def delete_phrase(
     phrase_uuid, _ = get_phrase_with_authorization(repo, phrase_id, user)
     
     repo.delete_phrase(phrase_uuid)
+    db.commit()
     
     return {"message": "フレーズが削除されました"}
 
@@ -232,7 +236,7 @@ async def update_phrase(
     
     updated_phrase = repo.update_mastered_status(phrase_uuid, request.is_mastered)
     
-    return SavedPhraseResponse(
+    response = SavedPhraseResponse(
         id=str(updated_phrase.id),
         phrase=updated_phrase.phrase,
         context=updated_phrase.context,
@@ -240,3 +244,6 @@ async def update_phrase(
         is_mastered=updated_phrase.is_mastered,
         created_at=updated_phrase.created_at
     )
+    db.commit()
+    
+    return response
@@ -9,6 +9,7 @@ import logging
 from sqlalchemy.orm import Session
 
 from services.problem_generator import get_problem_generator
+from services.archive_cache import get_archive_cache
 from exceptions import ProblemGenerationError, ExternalAPIError
 from database import get_db
 from models import PracticeSession, User
@@ -123,6 +124,8 @@ async def generate_problem(request: ProblemGenerateRequest, db: Session = Depend
             logger.info("Committing to database...")
             db.commit()
             logger.info(f"✅ Practice session created in database: {problem_data['problem_id']}")
+            if request.task_type == "task1":
+                await get_archive_cache().invalidate_user(request.user_id)
         except Exception as db_error:
             logger.error(f"❌ Failed to create practice session in database: {db_error}")
             logger.error(f"Error type: {type(db_error).__name__}")
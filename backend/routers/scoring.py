@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 from database import get_db
 from models import PracticeSession
 from services.scoring_service import get_scoring_service, ScoringService
+from services.archive_cache import get_archive_cache
 from exceptions import ScoringError, ExternalAPIError
 from utils.audio_cleanup import schedule_audio_cleanup
 
@@ -196,6 +197,8 @@ async def evaluate_task1_response(
         
         db.commit()
         logger.info(f"Task 1 scoring completed and saved for problem_id: {request.problem_id}")
+        if session.user is not None:
+            await get_archive_cache().invalidate_user(session.user.user_identifier)
         
         # Clean up audio file after scoring
         schedule_audio_cleanup(request.problem_id)
@@ -2,21 +2,41 @@
 Task1 Archive router for TOEFL Speaking Master API.
 Handles retrieval of past Task1 questions and responses.
 """
+import hashlib
 import logging
-from typing import List, Optional
+import re
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, desc, func, lambda_stmt, select, tuple_
 
-from database import get_db
+from database import get_async_db
 from models import PracticeSession, User
 from exceptions import ValidationError
+from services.archive_cache import get_archive_cache
 
 
 logger = logging.getLogger(__name__)
 
+# Canonical hyphenated UUID; checked before UUID() so malformed IDs are
+# rejected without raising and catching an exception
+_UUID_RE = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z",
+    re.IGNORECASE
+)
+
+# User lookup shared by both routes, compiled once and reused from
+# SQLAlchemy's statement cache
+_select_user_id_by_identifier = lambda_stmt(
+    lambda: select(User.id).where(User.user_identifier == bindparam("user_identifier"))
+)
+
+# Let the browser reuse archive responses across rapid re-renders
+ARCHIVE_CACHE_CONTROL = "private, max-age=10"
+
 router = APIRouter(
     prefix="/api/task1-archive",
     tags=["task1-archive"]
@@ -37,14 +57,61 @@ class Task1ArchiveResponse(BaseModel):
     """Response model for Task1 archive."""
     questions: List[Task1QuestionResponse] = Field(..., description="List of Task1 questions")
     total: int = Field(..., description="Total number of questions")
+    next_cursor: Optional[str] = Field(None, description="Cursor for fetching the next page, if any")
+
+
+def _parse_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Parse a keyset pagination cursor of the form "{created_at},{id}".
+
+    Args:
+        cursor: Cursor returned as next_cursor by a previous page
+
+    Returns:
+        Tuple of (created_at, id) of the last row of the previous page
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    created_at, _, session_id = cursor.rpartition(",")
+    if not _UUID_RE.match(session_id):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    try:
+        return datetime.fromisoformat(created_at), UUID(session_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
+def _json_response(body: str, if_none_match: Optional[str]) -> Response:
+    """
+    Build a JSON response with Cache-Control and a content-derived ETag.
+
+    Args:
+        body: Serialized JSON response body
+        if_none_match: Value of the client's If-None-Match header
 
-@router.get("/questions", response_model=Task1ArchiveResponse)
+    Returns:
+        200 response with the body, or an empty 304 if the client's copy is current
+    """
+    etag = f'"{hashlib.blake2b(body.encode(), digest_size=16).hexdigest()}"'
+    headers = {"Cache-Control": ARCHIVE_CACHE_CONTROL, "ETag": etag}
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get(
+    "/questions",
+    response_model=None,
+    responses={200: {"model": Task1ArchiveResponse}}
+)
 async def get_task1_questions(
     user_id: str = Query(..., description="User identifier"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of questions to return"),
     offset: int = Query(0, ge=0, description="Number of questions to skip"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (keyset pagination)"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get Task1 questions for a user.
@@ -52,14 +119,32 @@ async def get_task1_questions(
     Returns a list of Task1 questions that the user has attempted,
     ordered by creation date (most recent first).
     
+    The page and the total count are fetched in a single query using
+    COUNT(*) OVER (). Pass the returned next_cursor as cursor to page
+    through the archive without the O(offset) cost of OFFSET. The cursor
+    is the (created_at, id) of the last row, so rows sharing a timestamp
+    are neither skipped nor repeated across pages.
+    
+    Only the columns needed for the response are selected, and responses
+    are built with model_construct since the values come straight from
+    typed database columns (response_model=None skips re-validation).
+    
+    Serialized pages are memoized per user in Redis (see ArchiveCache) and
+    invalidated when one of the user's Task1 sessions is written, so repeat
+    views skip the database entirely. Responses carry Cache-Control and an
+    ETag; a matching If-None-Match yields an empty 304.
+    
     Args:
         user_id: User identifier
         limit: Maximum number of questions to return (1-100)
         offset: Number of questions to skip for pagination
+        cursor: Only return questions after this position in the archive
+        if_none_match: ETag of the client's cached copy, if any
         db: Database session
         
     Returns:
-        Task1ArchiveResponse with questions and total count
+        Task1ArchiveResponse with questions, total count of matching
+        questions (after cursor, if given) and next page cursor
         
     Raises:
         HTTPException: If user not found or database error
@@ -67,40 +152,75 @@ async def get_task1_questions(
     try:
         logger.info(f"Fetching Task1 questions for user: {user_id}")
         
+        archive_cache = get_archive_cache()
+        cached_page = await archive_cache.get_page(user_id, limit, offset, cursor)
+        if cached_page is not None:
+            return _json_response(cached_page, if_none_match)
+        
         # Find user by identifier
-        user = db.query(User).filter(User.user_identifier == user_id).first()
-        if not user:
+        user_uuid = await db.scalar(_select_user_id_by_identifier, {"user_identifier": user_id})
+        if not user_uuid:
                 raise HTTPException(status_code=404, detail="User not found")
         
-        # Query Task1 sessions for this user
-        query = db.query(PracticeSession).filter(
-            PracticeSession.user_id == user.id,
+        # Query Task1 sessions for this user, with the total count as a window column
+        filters = [
+            PracticeSession.user_id == user_uuid,
             PracticeSession.task_type == "task1"
-        ).order_by(desc(PracticeSession.created_at))
+        ]
+        if cursor is not None:
+            filters.append(
+                tuple_(PracticeSession.created_at, PracticeSession.id) < tuple_(*_parse_cursor(cursor))
+            )
         
-        # Get total count
-        total = query.count()
+        rows = (await db.execute(
+            select(
+                PracticeSession.id,
+                PracticeSession.question,
+                PracticeSession.user_transcript,
+                PracticeSession.overall_score,
+                PracticeSession.created_at,
+                func.count().over().label("total")
+            )
+            .where(*filters)
+            .order_by(desc(PracticeSession.created_at), desc(PracticeSession.id))
+            .offset(offset)
+            .limit(limit)
+        )).all()
         
-        # Apply pagination
-        sessions = query.offset(offset).limit(limit).all()
+        if rows:
+            total = rows[0].total
+        elif offset > 0:
+            # Page is past the end, so no row carries the window count
+            total = await db.scalar(select(func.count(PracticeSession.id)).where(*filters))
+        else:
+            total = 0
         
         # Convert to response format
-        questions = []
-        for session in sessions:
-            questions.append(Task1QuestionResponse(
-                id=str(session.id),
-                question=session.question,
-                user_transcript=session.user_transcript,
-                overall_score=session.overall_score,
-                created_at=session.created_at.isoformat()
-            ))
+        questions = [
+            Task1QuestionResponse.model_construct(
+                id=str(row.id),
+                question=row.question,
+                user_transcript=row.user_transcript,
+                overall_score=row.overall_score,
+                created_at=row.created_at.isoformat()
+            )
+            for row in rows
+        ]
         
         logger.info(f"Retrieved {len(questions)} Task1 questions for user {user_id}")
         
-        return Task1ArchiveResponse(
+        next_cursor = None
+        if len(rows) == limit and offset + limit < total:
+            next_cursor = f"{rows[-1].created_at.isoformat()},{rows[-1].id}"
+        
+        page_json = Task1ArchiveResponse.model_construct(
             questions=questions,
-            total=total
-        )
+            total=total,
+            next_cursor=next_cursor
+        ).model_dump_json()
+        await archive_cache.set_page(user_id, limit, offset, cursor, page_json)
+        
+        return _json_response(page_json, if_none_match)
         
     except HTTPException:
         raise
@@ -109,11 +229,16 @@ async def get_task1_questions(
         raise HTTPException(status_code=500, detail="Failed to fetch Task1 questions")
 
 
-@router.get("/questions/{question_id}", response_model=Task1QuestionResponse)
+@router.get(
+    "/questions/{question_id}",
+    response_model=None,
+    responses={200: {"model": Task1QuestionResponse}}
+)
 async def get_task1_question(
     question_id: str,
     user_id: str = Query(..., description="User identifier"),
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific Task1 question by ID.
@@ -121,10 +246,11 @@ async def get_task1_question(
     Args:
         question_id: Session ID of the Task1 question
         user_id: User identifier
+        if_none_match: ETag of the client's cached copy, if any
         db: Database session
         
     Returns:
-        Task1QuestionResponse with question details
+        Task1QuestionResponse with question details (304 if unchanged)
         
     Raises:
         HTTPException: If question not found or access denied
@@ -133,33 +259,30 @@ async def get_task1_question(
         logger.info(f"Fetching Task1 question {question_id} for user {user_id}")
         
         # Validate question_id format
-        try:
-            question_uuid = UUID(question_id)
-        except ValueError:
+        if not _UUID_RE.match(question_id):
             raise HTTPException(status_code=400, detail="Invalid question ID format")
+        question_uuid = UUID(question_id)
         
         # Find user by identifier
-        user = db.query(User).filter(User.user_identifier == user_id).first()
-        if not user:
+        user_uuid = await db.scalar(_select_user_id_by_identifier, {"user_identifier": user_id})
+        if not user_uuid:
             raise HTTPException(status_code=404, detail="User not found")
         
-        # Find the specific Task1 session
-        session = db.query(PracticeSession).filter(
-            PracticeSession.id == question_uuid,
-            PracticeSession.user_id == user.id,
-            PracticeSession.task_type == "task1"
-        ).first()
+        # Find the specific Task1 session by primary key, then check ownership
+        session = await db.get(PracticeSession, question_uuid)
         
-        if not session:
+        if not session or session.user_id != user_uuid or session.task_type != "task1":
             raise HTTPException(status_code=404, detail="Task1 question not found")
         
-        return Task1QuestionResponse(
+        question_json = Task1QuestionResponse(
             id=str(session.id),
             question=session.question,
             user_transcript=session.user_transcript,
             overall_score=session.overall_score,
             created_at=session.created_at.isoformat()
-        )
+        ).model_dump_json()
+        
+        return _json_response(question_json, if_none_match)
         
     except HTTPException:
         raise
@@ -0,0 +1,132 @@
+"""
+Redis-backed cache of Task1 archive pages for TOEFL Speaking Master API.
+Serves repeat archive views without a database round trip.
+"""
+import os
+import logging
+from typing import Optional
+
+import redis
+
+from services.redis_client import RedisCache
+
+
+logger = logging.getLogger(__name__)
+
+# Pages are short-lived; explicit invalidation covers writes made by this app
+ARCHIVE_CACHE_TTL_SECONDS = int(os.getenv("ARCHIVE_CACHE_TTL_SECONDS", "30"))
+
+
+class ArchiveCache(RedisCache):
+    """
+    Cache of serialized Task1 archive pages per user.
+
+    All pages of one user live in a single Redis hash "t1:{user_identifier}"
+    with one field per (limit, offset, cursor) combination, so invalidating
+    a user is a single DEL instead of a SCAN over per-page keys. The hash
+    expires ARCHIVE_CACHE_TTL_SECONDS after its first page was written
+    (EXPIRE NX, Redis 7+), so no page outlives the TTL even while the user
+    keeps paging. When REDIS_URL is not configured (or Redis is unreachable)
+    every operation degrades to a no-op and callers fall back to the database.
+    """
+
+    @staticmethod
+    def _user_key(user_identifier: str) -> str:
+        return f"t1:{user_identifier}"
+
+    @staticmethod
+    def _page_field(limit: int, offset: int, cursor: Optional[str]) -> str:
+        return f"{limit}:{offset}:{cursor or ''}"
+
+    async def get_page(
+        self,
+        user_identifier: str,
+        limit: int,
+        offset: int,
+        cursor: Optional[str]
+    ) -> Optional[str]:
+        """
+        Look up a cached archive page.
+
+        Args:
+            user_identifier: Identifier of the archive owner
+            limit: Page size
+            offset: Page offset
+            cursor: Keyset pagination cursor, if any
+
+        Returns:
+            Serialized Task1ArchiveResponse JSON or None on cache miss
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            return await self.client.hget(
+                self._user_key(user_identifier),
+                self._page_field(limit, offset, cursor)
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read cached archive page: {e}")
+            return None
+
+    async def set_page(
+        self,
+        user_identifier: str,
+        limit: int,
+        offset: int,
+        cursor: Optional[str],
+        page_json: str
+    ) -> None:
+        """
+        Cache a serialized archive page.
+
+        Args:
+            user_identifier: Identifier of the archive owner
+            limit: Page size
+            offset: Page offset
+            cursor: Keyset pagination cursor, if any
+            page_json: Serialized Task1ArchiveResponse JSON
+        """
+        if not self.enabled:
+            return
+
+        key = self._user_key(user_identifier)
+        try:
+            pipe = self.client.pipeline()
+            pipe.hset(key, self._page_field(limit, offset, cursor), page_json)
+            pipe.expire(key, ARCHIVE_CACHE_TTL_SECONDS, nx=True)
+            await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Failed to cache archive page: {e}")
+
+    async def invalidate_user(self, user_identifier: str) -> None:
+        """
+        Drop all cached archive pages of a user.
+
+        Args:
+            user_identifier: Identifier of the archive owner
+        """
+        if not self.enabled:
+            return
+
+        try:
+            await self.client.delete(self._user_key(user_identifier))
+        except redis.RedisError as e:
+            logger.warning(f"Failed to invalidate cached archive pages: {e}")
+
+
+# Singleton instance
+_archive_cache: Optional[ArchiveCache] = None
+
+
+def get_archive_cache() -> ArchiveCache:
+    """
+    Get or create singleton archive cache instance.
+
+    Returns:
+        ArchiveCache instance
+    """
+    global _archive_cache
+    if _archive_cache is None:
+        _archive_cache = ArchiveCache()
+    return _archive_cache
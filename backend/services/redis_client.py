@@ -0,0 +1,91 @@
+"""
+Shared Redis client for TOEFL Speaking Master API caches.
+All caches in a process reuse one client and its connection pool.
+"""
+import os
+import logging
+from typing import Optional
+
+import redis.asyncio
+
+
+logger = logging.getLogger(__name__)
+
+# Keep Redis stalls short: a slow cache must degrade to a database lookup,
+# not hold the request for the client's default multi-second timeouts
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "0.25"))
+
+
+def create_redis_client(redis_url: Optional[str] = None) -> Optional[redis.asyncio.Redis]:
+    """
+    Create an async Redis client with short socket timeouts.
+
+    Args:
+        redis_url: Redis connection URL (defaults to REDIS_URL env var)
+
+    Returns:
+        Redis client, or None if no URL is configured
+    """
+    redis_url = redis_url or os.getenv("REDIS_URL")
+    if not redis_url:
+        logger.info("REDIS_URL not set, Redis caches disabled")
+        return None
+
+    logger.info("Redis client initialized")
+    return redis.asyncio.Redis.from_url(
+        redis_url,
+        decode_responses=True,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS
+    )
+
+
+class RedisCache:
+    """
+    Base class for caches backed by the shared Redis client.
+
+    When REDIS_URL is not configured the client is None and subclasses
+    treat every operation as a no-op, so callers fall back to the database.
+    """
+
+    def __init__(self, client: Optional[redis.asyncio.Redis] = None):
+        """
+        Initialize cache.
+
+        Args:
+            client: Redis client (defaults to the shared client)
+        """
+        self.client = client if client is not None else get_redis_client()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Redis backend is configured."""
+        return self.client is not None
+
+
+# Singleton instance; None is a valid (disabled) value, so track creation separately
+_redis_client: Optional[redis.asyncio.Redis] = None
+_redis_client_created = False
+
+
+def get_redis_client() -> Optional[redis.asyncio.Redis]:
+    """
+    Get or create the shared Redis client.
+
+    Returns:
+        Redis client, or None if REDIS_URL is not configured
+    """
+    global _redis_client, _redis_client_created
+    if not _redis_client_created:
+        _redis_client = create_redis_client()
+        _redis_client_created = True
+    return _redis_client
+
+
+async def close_redis_client() -> None:
+    """Close the shared Redis client's connection pool, if one was created."""
+    global _redis_client, _redis_client_created
+    if _redis_client is not None:
+        await _redis_client.aclose()
+    _redis_client = None
+    _redis_client_created = False
@@ -0,0 +1,168 @@
+"""
+Redis-backed session cache for TOEFL Speaking Master API.
+Resolves session tokens to users without a database round trip.
+"""
+import os
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+import redis
+import redis.asyncio
+
+from services.redis_client import RedisCache
+
+
+logger = logging.getLogger(__name__)
+
+# Longest a cached session is trusted before it is confirmed against the
+# database again; bounds how long a logged-out session or deleted user can
+# be resurrected by a lookup that raced the delete
+SESSION_CACHE_MAX_TTL_SECONDS = int(os.getenv("SESSION_CACHE_MAX_TTL_SECONDS", "300"))
+
+
+class SessionCache(RedisCache):
+    """
+    Cache of session token -> (user_id, user_identifier, expires_at).
+
+    Callers pass the hashed token (see routers.auth.hash_session_token), never
+    the raw client token. Entries are stored under "sess:{token}" and expire via Redis TTL
+    after at most SESSION_CACHE_MAX_TTL_SECONDS, or earlier when the session
+    itself expires, so no expiry bookkeeping is needed on the read path. When REDIS_URL is not configured (or Redis is unreachable)
+    every operation degrades to a no-op and callers fall back to the database.
+    Hit/miss counters are kept per process to monitor the hit ratio.
+    """
+
+    def __init__(self, client: Optional[redis.asyncio.Redis] = None):
+        """
+        Initialize session cache.
+
+        Args:
+            client: Redis client (defaults to the shared client)
+        """
+        super().__init__(client)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """Fraction of lookups served from the cache, or None before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary with enabled flag, hit/miss counts and hit ratio
+        """
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio
+        }
+
+    @staticmethod
+    def _session_key(session_token: str) -> str:
+        return f"sess:{session_token}"
+
+    async def set_session(
+        self,
+        session_token: str,
+        user_id: UUID,
+        user_identifier: str,
+        expires_at: datetime
+    ) -> None:
+        """
+        Cache a session until it expires, for at most SESSION_CACHE_MAX_TTL_SECONDS.
+
+        Args:
+            session_token: Session token
+            user_id: UUID of the session owner
+            user_identifier: Identifier of the session owner
+            expires_at: Session expiration time (UTC)
+        """
+        if not self.enabled:
+            return
+
+        expires_at_epoch = expires_at.replace(tzinfo=timezone.utc).timestamp()
+        ttl_seconds = min(int(expires_at_epoch - time.time()), SESSION_CACHE_MAX_TTL_SECONDS)
+        if ttl_seconds <= 0:
+            return
+
+        try:
+            await self.client.setex(
+                self._session_key(session_token),
+                ttl_seconds,
+                f"{user_id}|{expires_at_epoch}|{user_identifier}"
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to cache session: {e}")
+
+    async def get_session(self, session_token: str) -> Optional[Tuple[UUID, str, datetime]]:
+        """
+        Look up a cached session.
+
+        Args:
+            session_token: Session token
+
+        Returns:
+            Tuple of (user_id, user_identifier, expires_at) or None on cache miss
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            value = await self.client.get(self._session_key(session_token))
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read cached session: {e}")
+            value = None
+
+        if value:
+            try:
+                # user_identifier goes last since it is free-form text
+                user_id, expires_at_epoch, user_identifier = value.split("|", 2)
+                expires_at = datetime.utcfromtimestamp(float(expires_at_epoch))
+                self.hits += 1
+                return UUID(user_id), user_identifier, expires_at
+            except ValueError:
+                logger.warning("Discarding malformed cached session entry")
+
+        self.misses += 1
+        return None
+
+    async def delete_session(self, session_token: str) -> None:
+        """
+        Remove a session from the cache.
+
+        Args:
+            session_token: Session token
+        """
+        if not self.enabled:
+            return
+
+        try:
+            await self.client.delete(self._session_key(session_token))
+        except redis.RedisError as e:
+            logger.warning(f"Failed to delete cached session: {e}")
+
+
+# Singleton instance
+_session_cache: Optional[SessionCache] = None
+
+
+def get_session_cache() -> SessionCache:
+    """
+    Get or create singleton session cache instance.
+
+    Returns:
+        SessionCache instance
+    """
+    global _session_cache
+    if _session_cache is None:
+        _session_cache = SessionCache()
+    return _session_cache
@@ -0,0 +1,11 @@
+"""
+Shared test configuration.
+"""
+import os
+
+# main.py refuses to start without a session token key
+os.environ.setdefault("SESSION_TOKEN_SECRET", "test-session-token-secret")
+
+# All app tests share one TestClient address, so the default per-client
+# limit would start returning 429 partway through a full run
+os.environ.setdefault("RATE_LIMIT_PER_MINUTE", "100000")
@@ -0,0 +1,59 @@
+"""
+In-memory stand-in for the async Redis client used by the caches.
+"""
+
+
+class FakePipeline:
+    """Queues commands and applies them to the FakeRedis on execute."""
+
+    def __init__(self, fake):
+        self.fake = fake
+        self.commands = []
+
+    def hset(self, key, field, value):
+        self.commands.append(lambda: self.fake.hset_now(key, field, value))
+        return self
+
+    def expire(self, key, ttl, nx=False):
+        self.commands.append(lambda: self.fake.expire_now(key, ttl, nx))
+        return self
+
+    async def execute(self):
+        results = [command() for command in self.commands]
+        self.commands = []
+        return results
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio client methods the caches use."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def hget(self, key, field):
+        return self.store.get(key, {}).get(field)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+            self.ttls.pop(key, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def hset_now(self, key, field, value):
+        self.store.setdefault(key, {})[field] = value
+
+    def expire_now(self, key, ttl, nx=False):
+        if key not in self.store or (nx and key in self.ttls):
+            return False
+        self.ttls[key] = ttl
+        return True
@@ -0,0 +1,85 @@
+"""
+Tests for the Redis-backed Task1 archive cache.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import redis
+
+from services import redis_client
+from services.archive_cache import ArchiveCache, ARCHIVE_CACHE_TTL_SECONDS, get_archive_cache
+from tests.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def cache():
+    """Create an archive cache backed by an in-memory fake."""
+    archive_cache = ArchiveCache()
+    archive_cache.client = FakeRedis()
+    return archive_cache
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_without_redis_url(monkeypatch):
+    """Test that the cache is a no-op when REDIS_URL is not configured."""
+    monkeypatch.setattr(redis_client, "get_redis_client", lambda: None)
+    archive_cache = ArchiveCache()
+
+    assert not archive_cache.enabled
+    await archive_cache.set_page("user", 50, 0, None, "{}")
+    assert await archive_cache.get_page("user", 50, 0, None) is None
+
+
+def test_get_archive_cache_singleton():
+    """Test singleton pattern for cache."""
+    assert get_archive_cache() is get_archive_cache()
+
+
+@pytest.mark.asyncio
+async def test_set_and_get_page(cache):
+    """Test that pages round-trip per (limit, offset, cursor) with a TTL."""
+    cursor = "2025-01-01T12:00:00,6f1c2b9e-3d4a-4f5b-8c7d-1e2f3a4b5c6d"
+    await cache.set_page("user", 50, 0, None, '{"page": 1}')
+    await cache.set_page("user", 50, 0, cursor, '{"page": 2}')
+
+    assert await cache.get_page("user", 50, 0, None) == '{"page": 1}'
+    assert await cache.get_page("user", 50, 0, cursor) == '{"page": 2}'
+    assert await cache.get_page("user", 20, 0, None) is None
+    assert cache.client.ttls["t1:user"] == ARCHIVE_CACHE_TTL_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_later_pages_do_not_extend_ttl(cache):
+    """Test that writing more pages keeps the expiry set by the first page."""
+    await cache.set_page("user", 50, 0, None, "{}")
+    cache.client.ttls["t1:user"] = 5  # simulate time passing
+    await cache.set_page("user", 50, 50, None, "{}")
+
+    assert cache.client.ttls["t1:user"] == 5
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user(cache):
+    """Test that invalidation drops every page of one user only."""
+    await cache.set_page("user", 50, 0, None, "{}")
+    await cache.set_page("user", 10, 10, None, "{}")
+    await cache.set_page("other", 50, 0, None, "{}")
+
+    await cache.invalidate_user("user")
+
+    assert await cache.get_page("user", 50, 0, None) is None
+    assert await cache.get_page("user", 10, 10, None) is None
+    assert await cache.get_page("other", 50, 0, None) == "{}"
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_degrade_to_cache_miss(cache):
+    """Test that Redis failures are treated as cache misses."""
+    cache.client = MagicMock()
+    cache.client.hget = AsyncMock(side_effect=redis.TimeoutError("timed out"))
+    cache.client.pipeline.return_value.execute = AsyncMock(side_effect=redis.ConnectionError("down"))
+    cache.client.delete = AsyncMock(side_effect=redis.ConnectionError("down"))
+
+    await cache.set_page("user", 50, 0, None, "{}")
+    await cache.invalidate_user("user")
+    assert await cache.get_page("user", 50, 0, None) is None
@@ -2,44 +2,56 @@
 Integration tests for authentication functionality.
 Tests Requirements: 1.1, 1.2
 """
+import asyncio
+import os
+import tempfile
 import pytest
+from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 from main import app
-from database import get_db
-from models import Base, User
+from database import get_async_db
+from models import Base, User, Session as DBSession
+from routers.auth import hash_session_token
 
 
-# Create in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# File-backed SQLite database shared by the sync test engine and the async app engine
+_db_fd, TEST_DB_PATH = tempfile.mkstemp(suffix=".db")
+os.close(_db_fd)
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
+    f"sqlite:///{TEST_DB_PATH}",
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    poolclass=NullPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{TEST_DB_PATH}", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
-def override_get_db():
-    """Override database dependency for testing."""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
 
+async def override_get_async_db():
+    """Override async database dependency for testing."""
+    async with TestingAsyncSessionLocal() as db:
+        yield db
 
-# Override the dependency
-app.dependency_overrides[get_db] = override_get_db
 
 # Create test client
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def override_async_db():
+    """Point the async database dependency at the test database for each test."""
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield
+    app.dependency_overrides.pop(get_async_db, None)
+
+
 @pytest.fixture(autouse=True)
 def setup_database():
     """Create all tables for auth tests."""
@@ -171,3 +183,275 @@ def test_user_data_association():
     verify_data = verify_response.json()
     assert verify_data["user_id"] == user_id
     assert verify_data["user_identifier"] == "association_test_user"
+
+
+@pytest.fixture
+def session_cache(monkeypatch):
+    """Enable the session cache with an in-memory Redis stand-in."""
+    from services import session_cache as session_cache_module
+    from tests.fake_redis import FakeRedis
+
+    cache = session_cache_module.SessionCache()
+    cache.client = FakeRedis()
+    monkeypatch.setattr(session_cache_module, "_session_cache", cache)
+    return cache
+
+
+def test_verify_session_served_from_cache(session_cache):
+    """
+    Test that a cached session is verified without touching the database
+    until the cache entry expires.
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "cached_user"}
+    )
+    session_token = login_response.json()["session_token"]
+    user_id = login_response.json()["user_id"]
+    
+    # Remove the session and user rows; the cached entry should still resolve
+    db = TestingSessionLocal()
+    db.query(DBSession).delete()
+    db.query(User).delete()
+    db.commit()
+    db.close()
+    
+    verify_response = client.get(
+        f"/api/auth/verify?session_token={session_token}"
+    )
+    
+    assert verify_response.status_code == 200
+    assert verify_response.json()["user_id"] == user_id
+    assert verify_response.json()["user_identifier"] == "cached_user"
+    
+    # Once the capped TTL lapses the session is confirmed against the database again
+    session_cache.client.store.clear()
+    verify_response = client.get(
+        f"/api/auth/verify?session_token={session_token}"
+    )
+    assert verify_response.status_code == 401
+
+
+def test_logout_evicts_cached_session(session_cache):
+    """
+    Test that logging out removes the session from the cache.
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "logout_cache_user"}
+    )
+    session_token = login_response.json()["session_token"]
+    
+    client.post(f"/api/auth/logout?session_token={session_token}")
+    
+    assert asyncio.run(session_cache.get_session(hash_session_token(session_token))) is None
+    verify_response = client.get(
+        f"/api/auth/verify?session_token={session_token}"
+    )
+    assert verify_response.status_code == 401
+
+
+def test_expired_session_rejected_without_delete():
+    """
+    Test that an expired session is rejected but left for the cleanup job.
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "expired_user"}
+    )
+    session_token = login_response.json()["session_token"]
+    
+    db = TestingSessionLocal()
+    db_session = db.query(DBSession).filter(DBSession.session_token == hash_session_token(session_token)).first()
+    db_session.expires_at = datetime.utcnow() - timedelta(minutes=1)
+    db.commit()
+    
+    verify_response = client.get(
+        f"/api/auth/verify?session_token={session_token}"
+    )
+    
+    assert verify_response.status_code == 401
+    assert db.query(DBSession).filter(DBSession.session_token == hash_session_token(session_token)).count() == 1
+    db.close()
+
+
+def test_repeated_login_does_not_duplicate_user():
+    """
+    Test that the login upsert keeps a single user row per identifier.
+    Requirements: 1.1
+    """
+    for _ in range(3):
+        response = client.post(
+            "/api/auth/simple-login",
+            json={"user_id": "upsert_user"}
+        )
+        assert response.status_code == 200
+    
+    db = TestingSessionLocal()
+    assert db.query(User).filter(User.user_identifier == "upsert_user").count() == 1
+    assert db.query(DBSession).count() == 3
+    db.close()
+
+
+def _set_session_expiry(session_token: str, expires_at: datetime):
+    """Set the stored expiration time of a session."""
+    db = TestingSessionLocal()
+    db.query(DBSession).filter(DBSession.session_token == hash_session_token(session_token)).update(
+        {DBSession.expires_at: expires_at}
+    )
+    db.commit()
+    db.close()
+
+
+def _get_session_expiry(session_token: str) -> datetime:
+    """Get the stored expiration time of a session."""
+    db = TestingSessionLocal()
+    expires_at = db.query(DBSession.expires_at).filter(
+        DBSession.session_token == hash_session_token(session_token)
+    ).scalar()
+    db.close()
+    return expires_at
+
+
+def test_session_extended_when_near_expiry():
+    """
+    Test that a session with less than 7 days left is extended to 30 days.
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "refresh_user"}
+    )
+    session_token = login_response.json()["session_token"]
+    _set_session_expiry(session_token, datetime.utcnow() + timedelta(days=2))
+    
+    verify_response = client.get(
+        f"/api/auth/verify?session_token={session_token}"
+    )
+    
+    assert verify_response.status_code == 200
+    assert _get_session_expiry(session_token) > datetime.utcnow() + timedelta(days=29)
+
+
+def test_session_not_extended_when_far_from_expiry():
+    """
+    Test that verifying a fresh session does not rewrite its expiration.
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "no_refresh_user"}
+    )
+    session_token = login_response.json()["session_token"]
+    original_expiry = datetime.utcnow() + timedelta(days=20)
+    _set_session_expiry(session_token, original_expiry)
+    
+    client.get(f"/api/auth/verify?session_token={session_token}")
+    
+    assert _get_session_expiry(session_token) == original_expiry
+
+
+def test_cached_session_extended_when_near_expiry(session_cache):
+    """
+    Test that a near-expiry cached session is extended in the database and cache.
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "cached_refresh_user"}
+    )
+    session_token = login_response.json()["session_token"]
+    near_expiry = datetime.utcnow() + timedelta(days=1)
+    _set_session_expiry(session_token, near_expiry)
+    user_id, user_identifier, _ = asyncio.run(session_cache.get_session(hash_session_token(session_token)))
+    asyncio.run(session_cache.set_session(hash_session_token(session_token), user_id, user_identifier, near_expiry))
+    
+    verify_response = client.get(
+        f"/api/auth/verify?session_token={session_token}"
+    )
+    
+    assert verify_response.status_code == 200
+    assert _get_session_expiry(session_token) > datetime.utcnow() + timedelta(days=29)
+    _, _, cached_expiry = asyncio.run(session_cache.get_session(hash_session_token(session_token)))
+    assert cached_expiry > datetime.utcnow() + timedelta(days=29)
+
+
+def test_verify_session_with_bearer_header():
+    """
+    Test that the session token is read from the Authorization header.
+    Requirements: 1.2
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "bearer_user"}
+    )
+    session_token = login_response.json()["session_token"]
+    
+    verify_response = client.get(
+        "/api/auth/verify",
+        headers={"Authorization": f"Bearer {session_token}"}
+    )
+    
+    assert verify_response.status_code == 200
+    assert verify_response.json()["user_identifier"] == "bearer_user"
+
+
+def test_verify_session_without_token():
+    """
+    Test that verify returns 401 when no token is sent.
+    Requirements: 1.2
+    """
+    verify_response = client.get("/api/auth/verify")
+    
+    assert verify_response.status_code == 401
+
+
+def test_logout_with_bearer_header():
+    """
+    Test that logout deletes the session identified by the Authorization header.
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "bearer_logout_user"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['session_token']}"}
+    
+    logout_response = client.post("/api/auth/logout", headers=headers)
+    
+    assert logout_response.status_code == 200
+    assert client.get("/api/auth/verify", headers=headers).status_code == 401
+
+
+def test_only_hashed_token_is_stored():
+    """
+    Test that the database stores a digest of the session token, not the token itself.
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "hashed_token_user"}
+    )
+    session_token = login_response.json()["session_token"]
+    
+    db = TestingSessionLocal()
+    stored_tokens = [row.session_token for row in db.query(DBSession).all()]
+    db.close()
+    
+    assert session_token not in stored_tokens
+    assert stored_tokens == [hash_session_token(session_token)]
+    assert len(stored_tokens[0]) == 32
+
+
+def test_logout_is_idempotent():
+    """
+    Test that logging out twice, or with an unknown token, succeeds.
+    """
+    login_response = client.post(
+        "/api/auth/simple-login",
+        json={"user_id": "double_logout_user"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['session_token']}"}
+    
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+    assert client.post("/api/auth/logout").status_code == 200
+    
+    db = TestingSessionLocal()
+    assert db.query(DBSession).count() == 0
+    db.close()
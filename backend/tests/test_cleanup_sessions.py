@@ -0,0 +1,140 @@
+"""
+Tests for the expired session cleanup job.
+"""
+import asyncio
+import threading
+import pytest
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import Base, User, Session as DBSession
+from jobs.cleanup_sessions import (
+    cleanup_expired_sessions,
+    maybe_cleanup_expired_sessions,
+    run_periodic_session_cleanup,
+    run_session_cleanup
+)
+
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db():
+    """Create tables and yield a database session."""
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def _create_sessions(db, expired: int, active: int):
+    """Create a user with the given number of expired and active sessions."""
+    user = User(user_identifier="cleanup_user")
+    db.add(user)
+    db.commit()
+    
+    now = datetime.utcnow()
+    for i in range(expired):
+        db.add(DBSession(user_id=user.id, session_token=f"expired_{i}", expires_at=now - timedelta(hours=1)))
+    for i in range(active):
+        db.add(DBSession(user_id=user.id, session_token=f"active_{i}", expires_at=now + timedelta(days=1)))
+    db.commit()
+
+
+def test_cleanup_deletes_only_expired_sessions(db):
+    """Test that only expired sessions are removed."""
+    _create_sessions(db, expired=5, active=3)
+    
+    deleted = cleanup_expired_sessions(db)
+    
+    assert deleted == 5
+    remaining = db.query(DBSession).all()
+    assert len(remaining) == 3
+    assert all(s.session_token.startswith("active_") for s in remaining)
+
+
+def test_cleanup_loops_over_batches(db):
+    """Test that cleanup keeps deleting until no expired rows remain."""
+    _create_sessions(db, expired=7, active=1)
+    
+    with patch("jobs.cleanup_sessions.time.sleep") as mock_sleep:
+        deleted = cleanup_expired_sessions(db, batch_size=2)
+    
+    # Three full batches of 2, then a partial batch of 1 ends the loop
+    assert mock_sleep.call_count == 3
+    
+    assert deleted == 7
+    assert db.query(DBSession).count() == 1
+
+
+def test_fallback_cleanup_is_probabilistic(db):
+    """Test that the fallback sweep only runs when the dice roll allows it."""
+    _create_sessions(db, expired=3, active=0)
+    
+    with patch("jobs.cleanup_sessions.random.random", return_value=0.99):
+        assert maybe_cleanup_expired_sessions(db) == 0
+    assert db.query(DBSession).count() == 3
+    
+    with patch("jobs.cleanup_sessions.random.random", return_value=0.0):
+        assert maybe_cleanup_expired_sessions(db) == 3
+    assert db.query(DBSession).count() == 0
+
+
+def test_cleanup_stops_after_current_batch_when_asked(db):
+    """Test that a set stop event ends the sweep after one batch."""
+    _create_sessions(db, expired=5, active=0)
+    stop_event = threading.Event()
+    stop_event.set()
+    
+    deleted = cleanup_expired_sessions(db, batch_size=2, stop_event=stop_event)
+    
+    assert deleted == 2
+    assert db.query(DBSession).count() == 3
+
+
+@pytest.mark.asyncio
+async def test_periodic_cleanup_waits_for_running_sweep_on_cancel():
+    """Test that cancelling the periodic job waits for the in-flight sweep."""
+    started = threading.Event()
+    finished = threading.Event()
+    
+    def fake_sweep(stop_event):
+        started.set()
+        # Simulate batches until asked to stop
+        while not stop_event.wait(0.01):
+            pass
+        finished.set()
+    
+    with patch("jobs.cleanup_sessions.random.uniform", return_value=0), \
+            patch("jobs.cleanup_sessions.run_session_cleanup", side_effect=fake_sweep):
+        task = asyncio.create_task(run_periodic_session_cleanup(interval_seconds=3600))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    
+    assert finished.is_set()
+
+
+def test_sweep_skipped_when_lock_held_elsewhere():
+    """Test that a sweep is skipped while another process holds the cleanup lock."""
+    @contextmanager
+    def lock_held(bind):
+        yield False
+    
+    with patch("jobs.cleanup_sessions._cleanup_lock", lock_held), \
+            patch("jobs.cleanup_sessions.cleanup_expired_sessions") as mock_cleanup:
+        assert run_session_cleanup() is None
+    
+    mock_cleanup.assert_not_called()
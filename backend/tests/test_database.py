@@ -0,0 +1,87 @@
+"""
+Tests for database URL handling.
+"""
+import ssl
+from unittest.mock import patch
+
+import certifi
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from database import to_async_url
+
+
+def test_to_async_url_sqlite():
+    """Test that SQLite URLs switch to the aiosqlite driver."""
+    assert to_async_url("sqlite:///./test.db") == ("sqlite+aiosqlite:///./test.db", {})
+
+
+def test_to_async_url_strips_libpq_params():
+    """Test that libpq-only parameters are removed and sslmode maps to ssl."""
+    url, connect_args = to_async_url(
+        "postgresql://u:p@host/db?sslmode=require&channel_binding=require&application_name=app"
+    )
+
+    assert url == "postgresql+asyncpg://u:p@host/db?application_name=app"
+    assert connect_args == {"ssl": "require"}
+
+    # The asyncpg dialect must not forward any libpq-only keyword to asyncpg.connect()
+    engine = create_async_engine(url, connect_args=connect_args)
+    _, kwargs = engine.sync_engine.dialect.create_connect_args(engine.sync_engine.url)
+    assert "sslmode" not in kwargs
+    assert "channel_binding" not in kwargs
+
+
+def test_to_async_url_without_sslmode():
+    """Test that plain PostgreSQL URLs get no extra connect args."""
+    assert to_async_url("postgresql://u:p@localhost:5432/db") == (
+        "postgresql+asyncpg://u:p@localhost:5432/db",
+        {}
+    )
+
+
+def test_to_async_url_unknown_backend():
+    """Test that URLs without a known async driver are returned unchanged."""
+    assert to_async_url("mysql://u:p@host/db") == ("mysql://u:p@host/db", {})
+
+
+def test_to_async_url_maps_connect_timeout():
+    """Test that connect_timeout becomes asyncpg's timeout argument."""
+    url, connect_args = to_async_url("postgresql://u:p@host/db?connect_timeout=10")
+
+    assert url == "postgresql+asyncpg://u:p@host/db"
+    assert connect_args == {"timeout": 10.0}
+
+
+def test_to_async_url_verify_full_uses_given_root_cert():
+    """Test that sslrootcert is loaded into an SSL context that checks the hostname."""
+    url, connect_args = to_async_url(
+        f"postgresql://u:p@host/db?sslmode=verify-full&sslrootcert={certifi.where()}"
+    )
+    context = connect_args["ssl"]
+
+    assert url == "postgresql+asyncpg://u:p@host/db"
+    assert isinstance(context, ssl.SSLContext)
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname
+
+
+def test_to_async_url_loads_client_certificate():
+    """Test that sslcert/sslkey are loaded for client certificate auth."""
+    with patch("database.ssl.create_default_context") as mock_create_context:
+        _, connect_args = to_async_url(
+            "postgresql://u:p@host/db?sslmode=verify-ca&sslrootcert=/ca.pem"
+            "&sslcert=/client.crt&sslkey=/client.key"
+        )
+
+    mock_create_context.assert_called_once_with(cafile="/ca.pem")
+    context = connect_args["ssl"]
+    context.load_cert_chain.assert_called_once_with("/client.crt", keyfile="/client.key")
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname is False
+
+
+def test_to_async_url_rejects_required_gss_encryption():
+    """Test that unsupported required features fail loudly instead of being dropped."""
+    with pytest.raises(ValueError):
+        to_async_url("postgresql://u:p@host/db?gssencmode=require")
@@ -0,0 +1,89 @@
+"""
+Tests for PhraseRepository.
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import User, SavedPhrase
+from repositories import phrase_repository
+from repositories.phrase_repository import PhraseRepository
+
+
+engine = create_engine(
+    "sqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db():
+    """Create tables and yield a database session."""
+    User.__table__.create(bind=engine, checkfirst=True)
+    SavedPhrase.__table__.create(bind=engine, checkfirst=True)
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    SavedPhrase.__table__.drop(bind=engine, checkfirst=True)
+    User.__table__.drop(bind=engine, checkfirst=True)
+
+
+@pytest.fixture
+def user(db):
+    """Create a test user."""
+    user = User(user_identifier="repo_test_user")
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def test_save_phrases_bulk(db, user, monkeypatch):
+    """Test bulk saving phrases across multiple batches."""
+    monkeypatch.setattr(phrase_repository, "BULK_BATCH_SIZE", 2)
+    repo = PhraseRepository(db)
+    rows = [
+        {"user_id": user.id, "phrase": f"Phrase {i}", "context": "Context", "category": "transition"}
+        for i in range(5)
+    ]
+    
+    inserted = repo.save_phrases_bulk(rows)
+    db.commit()
+    
+    assert inserted == 5
+    phrases = repo.get_user_phrases(user.id)
+    assert sorted(p.phrase for p in phrases) == [f"Phrase {i}" for i in range(5)]
+    assert all(p.is_mastered is False for p in phrases)
+    assert len({p.id for p in phrases}) == 5
+
+
+def test_save_phrases_bulk_empty(db):
+    """Test bulk saving no phrases."""
+    assert PhraseRepository(db).save_phrases_bulk([]) == 0
+
+
+def test_mutations_share_callers_transaction(db, user):
+    """Test that repository mutations are only persisted when the caller commits."""
+    repo = PhraseRepository(db)
+    first = repo.save_phrase(user.id, "First phrase", "Context", "transition")
+    second = repo.save_phrase(user.id, "Second phrase", "Context", "example")
+    repo.update_mastered_status(first.id, True)
+    repo.delete_phrase(second.id)
+    
+    assert first.id is not None
+    assert first.created_at is not None
+    
+    db.rollback()
+    assert repo.get_user_phrases(user.id) == []
+    
+    saved = repo.save_phrase(user.id, "Committed phrase", "Context", "conclusion")
+    repo.update_mastered_status(saved.id, True)
+    db.commit()
+    
+    other_session = TestingSessionLocal()
+    phrases = PhraseRepository(other_session).get_user_phrases(user.id)
+    assert [(p.phrase, p.is_mastered) for p in phrases] == [("Committed phrase", True)]
+    other_session.close()
@@ -0,0 +1,46 @@
+"""
+Tests for the shared Redis client.
+"""
+import pytest
+
+from services import redis_client
+from services.redis_client import REDIS_SOCKET_TIMEOUT_SECONDS, create_redis_client
+from services.session_cache import SessionCache
+from services.archive_cache import ArchiveCache
+
+
+def test_no_client_without_redis_url(monkeypatch):
+    """Test that no client is created when REDIS_URL is not configured."""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    assert create_redis_client() is None
+
+
+def test_client_uses_short_timeouts():
+    """Test that the client fails fast instead of using redis-py's default timeouts."""
+    client = create_redis_client("redis://localhost:6379/0")
+    kwargs = client.connection_pool.connection_kwargs
+
+    assert kwargs["socket_connect_timeout"] == REDIS_SOCKET_TIMEOUT_SECONDS
+    assert kwargs["socket_timeout"] == REDIS_SOCKET_TIMEOUT_SECONDS
+
+
+def test_caches_share_one_client(monkeypatch):
+    """Test that all caches reuse the same client and connection pool."""
+    client = create_redis_client("redis://localhost:6379/0")
+    monkeypatch.setattr(redis_client, "_redis_client", client)
+    monkeypatch.setattr(redis_client, "_redis_client_created", True)
+
+    assert SessionCache().client is client
+    assert ArchiveCache().client is client
+
+
+@pytest.mark.asyncio
+async def test_close_redis_client_resets_singleton(monkeypatch):
+    """Test that closing the shared client allows a fresh one to be created."""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    monkeypatch.setattr(redis_client, "_redis_client", create_redis_client("redis://localhost:6379/0"))
+    monkeypatch.setattr(redis_client, "_redis_client_created", True)
+
+    await redis_client.close_redis_client()
+
+    assert redis_client.get_redis_client() is None
@@ -0,0 +1,111 @@
+"""
+Tests for the Redis-backed session cache.
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import redis
+
+from services import redis_client
+from services.session_cache import SESSION_CACHE_MAX_TTL_SECONDS, SessionCache, get_session_cache
+from tests.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def cache():
+    """Create a session cache backed by an in-memory fake."""
+    session_cache = SessionCache()
+    session_cache.client = FakeRedis()
+    return session_cache
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_without_redis_url(monkeypatch):
+    """Test that the cache is a no-op when REDIS_URL is not configured."""
+    monkeypatch.setattr(redis_client, "get_redis_client", lambda: None)
+    session_cache = SessionCache()
+
+    assert not session_cache.enabled
+    await session_cache.set_session("token", uuid4(), "user", datetime.utcnow() + timedelta(days=1))
+    assert await session_cache.get_session("token") is None
+
+
+def test_get_session_cache_singleton():
+    """Test singleton pattern for cache."""
+    assert get_session_cache() is get_session_cache()
+
+
+@pytest.mark.asyncio
+async def test_set_and_get_session(cache):
+    """Test that a cached session round-trips with a TTL capped below its lifetime."""
+    user_id = uuid4()
+    expires_at = datetime.utcnow() + timedelta(days=30)
+
+    await cache.set_session("token", user_id, "cached_user", expires_at)
+
+    cached_user_id, user_identifier, cached_expiry = await cache.get_session("token")
+    assert cached_user_id == user_id
+    assert user_identifier == "cached_user"
+    assert abs(cached_expiry - expires_at) < timedelta(milliseconds=1)
+    assert "sess:token" in cache.client.store
+    assert cache.client.ttls["sess:token"] == SESSION_CACHE_MAX_TTL_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_ttl_bounded_by_session_expiry(cache):
+    """Test that a session expiring before the cap is cached only until it expires."""
+    await cache.set_session("token", uuid4(), "user", datetime.utcnow() + timedelta(seconds=60))
+
+    assert 55 < cache.client.ttls["sess:token"] <= 60
+
+
+@pytest.mark.asyncio
+async def test_user_identifier_may_contain_separator(cache):
+    """Test that identifiers containing the field separator round-trip."""
+    await cache.set_session("token", uuid4(), "odd|user", datetime.utcnow() + timedelta(days=1))
+
+    assert (await cache.get_session("token"))[1] == "odd|user"
+
+
+@pytest.mark.asyncio
+async def test_expired_session_not_cached(cache):
+    """Test that already-expired sessions are not written to the cache."""
+    await cache.set_session("token", uuid4(), "user", datetime.utcnow() - timedelta(seconds=1))
+
+    assert await cache.get_session("token") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_session(cache):
+    """Test that deleting a session removes it from the cache."""
+    await cache.set_session("token", uuid4(), "user", datetime.utcnow() + timedelta(days=1))
+    await cache.delete_session("token")
+
+    assert await cache.get_session("token") is None
+
+
+@pytest.mark.asyncio
+async def test_hit_ratio(cache):
+    """Test that lookups are counted as hits and misses."""
+    assert cache.hit_ratio is None
+
+    await cache.set_session("token", uuid4(), "user", datetime.utcnow() + timedelta(days=1))
+    await cache.get_session("token")
+    await cache.get_session("token")
+    await cache.get_session("missing")
+
+    assert cache.stats() == {"enabled": True, "hits": 2, "misses": 1, "hit_ratio": 2 / 3}
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_degrade_to_cache_miss(cache):
+    """Test that Redis failures are treated as cache misses."""
+    cache.client = MagicMock()
+    cache.client.get = AsyncMock(side_effect=redis.TimeoutError("timed out"))
+    cache.client.setex = AsyncMock(side_effect=redis.ConnectionError("down"))
+
+    await cache.set_session("token", uuid4(), "user", datetime.utcnow() + timedelta(days=1))
+    assert await cache.get_session("token") is None
+    assert cache.misses == 1
@@ -0,0 +1,379 @@
+"""
+Tests for Task1 archive router endpoints.
+"""
+import asyncio
+import os
+import tempfile
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from main import app
+from database import get_async_db, get_db
+from services.scoring_service import get_scoring_service
+from models import User, PracticeSession
+
+
+# File-backed SQLite database shared by the sync test engine and the async app engine
+_db_fd, TEST_DB_PATH = tempfile.mkstemp(suffix=".db")
+os.close(_db_fd)
+
+engine = create_engine(
+    f"sqlite:///{TEST_DB_PATH}",
+    connect_args={"check_same_thread": False},
+    poolclass=NullPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{TEST_DB_PATH}", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def override_get_async_db():
+    """Override async database dependency for testing."""
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def override_async_db():
+    """Point the async database dependency at the test database for each test."""
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield
+    app.dependency_overrides.pop(get_async_db, None)
+
+
+@pytest.fixture(autouse=True)
+def setup_database():
+    """Create tables before each test and drop after."""
+    User.__table__.create(bind=engine, checkfirst=True)
+    PracticeSession.__table__.create(bind=engine, checkfirst=True)
+    yield
+    PracticeSession.__table__.drop(bind=engine, checkfirst=True)
+    User.__table__.drop(bind=engine, checkfirst=True)
+
+
+@pytest.fixture
+def test_user():
+    """Create a test user with five Task1 sessions and one Task3 session."""
+    db = TestingSessionLocal()
+    user = User(user_identifier="test_user_task1")
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    
+    base_time = datetime(2025, 1, 1, 12, 0, 0)
+    session_ids = []
+    for i in range(5):
+        session = PracticeSession(
+            id=uuid4(),
+            user_id=user.id,
+            task_type="task1",
+            question=f"Task1 question {i}",
+            user_transcript=f"Answer {i}",
+            overall_score=i % 5,
+            created_at=base_time + timedelta(minutes=i)
+        )
+        db.add(session)
+        session_ids.append(str(session.id))
+    db.add(PracticeSession(
+        user_id=user.id,
+        task_type="task3",
+        reading_text="Reading",
+        lecture_script="Lecture",
+        question="Task3 question",
+        created_at=base_time
+    ))
+    db.commit()
+    
+    user_identifier = user.user_identifier
+    db.close()
+    return {"identifier": user_identifier, "session_ids": session_ids}
+
+
+def test_get_task1_questions(test_user):
+    """Test listing Task1 questions, most recent first."""
+    response = client.get(f"/api/task1-archive/questions?user_id={test_user['identifier']}")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 5
+    assert [q["question"] for q in data["questions"]] == [
+        f"Task1 question {i}" for i in reversed(range(5))
+    ]
+    assert data["next_cursor"] is None
+
+
+def test_get_task1_questions_offset_pagination(test_user):
+    """Test that total is reported on every page, including past the end."""
+    response = client.get(
+        f"/api/task1-archive/questions?user_id={test_user['identifier']}&limit=2&offset=2"
+    )
+    data = response.json()
+    assert data["total"] == 5
+    assert [q["question"] for q in data["questions"]] == ["Task1 question 2", "Task1 question 1"]
+    
+    response = client.get(
+        f"/api/task1-archive/questions?user_id={test_user['identifier']}&limit=2&offset=10"
+    )
+    data = response.json()
+    assert data["total"] == 5
+    assert data["questions"] == []
+
+
+def test_get_task1_questions_keyset_pagination(test_user):
+    """Test walking the archive with next_cursor."""
+    seen = []
+    cursor = None
+    while True:
+        url = f"/api/task1-archive/questions?user_id={test_user['identifier']}&limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url).json()
+        seen.extend(q["question"] for q in data["questions"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    
+    assert seen == [f"Task1 question {i}" for i in reversed(range(5))]
+
+
+def test_get_task1_questions_keyset_pagination_same_timestamp(test_user):
+    """Test that rows sharing the boundary timestamp are not skipped."""
+    db = TestingSessionLocal()
+    user = db.query(User).filter(User.user_identifier == test_user["identifier"]).first()
+    tied_time = datetime(2025, 1, 2, 12, 0, 0)
+    for i in range(3):
+        db.add(PracticeSession(
+            user_id=user.id,
+            task_type="task1",
+            question=f"Tied question {i}",
+            created_at=tied_time
+        ))
+    db.commit()
+    db.close()
+    
+    seen = []
+    cursor = None
+    while True:
+        url = f"/api/task1-archive/questions?user_id={test_user['identifier']}&limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url).json()
+        seen.extend(q["question"] for q in data["questions"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    
+    assert len(seen) == 8
+    assert sorted(seen[:3]) == [f"Tied question {i}" for i in range(3)]
+    assert seen[3:] == [f"Task1 question {i}" for i in reversed(range(5))]
+
+
+def test_get_task1_questions_invalid_cursor(test_user):
+    """Test that a malformed cursor is rejected."""
+    response = client.get(
+        f"/api/task1-archive/questions?user_id={test_user['identifier']}&cursor=2025-01-01T12:00:00"
+    )
+    assert response.status_code == 400
+
+
+def test_get_task1_questions_user_not_found():
+    """Test listing questions for an unknown user."""
+    response = client.get("/api/task1-archive/questions?user_id=nonexistent_user")
+    assert response.status_code == 404
+
+
+def test_get_task1_question(test_user):
+    """Test fetching a single Task1 question."""
+    question_id = test_user["session_ids"][0]
+    response = client.get(
+        f"/api/task1-archive/questions/{question_id}?user_id={test_user['identifier']}"
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == question_id
+    assert data["question"] == "Task1 question 0"
+
+
+def test_get_task1_question_invalid_id(test_user):
+    """Test fetching a question with a malformed ID."""
+    response = client.get(
+        f"/api/task1-archive/questions/not-a-uuid?user_id={test_user['identifier']}"
+    )
+    assert response.status_code == 400
+
+
+def test_get_task1_question_not_found(test_user):
+    """Test fetching a question that does not exist."""
+    response = client.get(
+        f"/api/task1-archive/questions/{uuid4()}?user_id={test_user['identifier']}"
+    )
+    assert response.status_code == 404
+
+
+def test_get_task1_question_other_user(test_user):
+    """Test that another user's question is not returned."""
+    db = TestingSessionLocal()
+    other_user = User(user_identifier="other_task1_user")
+    db.add(other_user)
+    db.commit()
+    db.close()
+    
+    question_id = test_user["session_ids"][0]
+    response = client.get(
+        f"/api/task1-archive/questions/{question_id}?user_id=other_task1_user"
+    )
+    assert response.status_code == 404
+
+
+def test_get_task1_question_rejects_non_canonical_id(test_user):
+    """Test that only canonical hyphenated UUIDs are accepted."""
+    question_id = test_user["session_ids"][0].replace("-", "")
+    response = client.get(
+        f"/api/task1-archive/questions/{question_id}?user_id={test_user['identifier']}"
+    )
+    assert response.status_code == 400
+    
+    response = client.get(
+        f"/api/task1-archive/questions/{test_user['session_ids'][0].upper()}?user_id={test_user['identifier']}"
+    )
+    assert response.status_code == 200
+
+
+@pytest.fixture
+def archive_cache(monkeypatch):
+    """Enable the archive cache with an in-memory Redis fake."""
+    from services import archive_cache as archive_cache_module
+    from tests.fake_redis import FakeRedis
+    
+    cache = archive_cache_module.ArchiveCache()
+    cache.client = FakeRedis()
+    monkeypatch.setattr(archive_cache_module, "_archive_cache", cache)
+    return cache
+
+
+def test_get_task1_questions_cache_headers(test_user):
+    """Test that archive responses carry Cache-Control and honor If-None-Match."""
+    url = f"/api/task1-archive/questions?user_id={test_user['identifier']}"
+    response = client.get(url)
+    
+    assert response.headers["cache-control"] == "private, max-age=10"
+    etag = response.headers["etag"]
+    
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    
+    response = client.get(url, headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+
+
+def test_get_task1_question_cache_headers(test_user):
+    """Test that single-question responses carry Cache-Control and an ETag."""
+    url = f"/api/task1-archive/questions/{test_user['session_ids'][0]}?user_id={test_user['identifier']}"
+    response = client.get(url)
+    
+    assert response.headers["cache-control"] == "private, max-age=10"
+    response = client.get(url, headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+
+
+def test_get_task1_questions_served_from_cache(test_user, archive_cache):
+    """Test that a repeat page view is served from the cache without the database."""
+    url = f"/api/task1-archive/questions?user_id={test_user['identifier']}&limit=2"
+    first = client.get(url)
+    
+    # Remove the rows; the cached page must still be returned
+    db = TestingSessionLocal()
+    db.query(PracticeSession).delete()
+    db.commit()
+    db.close()
+    
+    second = client.get(url)
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["etag"] == first.headers["etag"]
+    
+    asyncio.run(archive_cache.invalidate_user(test_user["identifier"]))
+    assert client.get(url).json()["total"] == 0
+
+
+@pytest.fixture
+def sync_db_override():
+    """Point the sync get_db dependency used by the write routers at the test database."""
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_generating_task1_problem_invalidates_cached_archive(test_user, archive_cache, sync_db_override):
+    """Test that creating a Task1 session drops the user's cached archive pages."""
+    url = f"/api/task1-archive/questions?user_id={test_user['identifier']}"
+    assert client.get(url).json()["total"] == 5
+    assert f"t1:{test_user['identifier']}" in archive_cache.client.store
+    
+    problem_data = {
+        "problem_id": str(uuid4()),
+        "question": "New Task1 question",
+        "task_type": "task1",
+        "preparation_time": 15,
+        "speaking_time": 45
+    }
+    with patch("routers.problems.get_problem_generator") as mock_get_generator:
+        mock_get_generator.return_value.generate_problem = AsyncMock(return_value=problem_data)
+        response = client.post(
+            "/api/problems/generate",
+            json={"task_type": "task1", "user_id": test_user["identifier"]}
+        )
+    
+    assert response.status_code == 201
+    assert f"t1:{test_user['identifier']}" not in archive_cache.client.store
+    assert client.get(url).json()["total"] == 6
+
+
+def test_scoring_task1_response_invalidates_cached_archive(test_user, archive_cache, sync_db_override):
+    """Test that saving a Task1 score drops the user's cached archive pages."""
+    url = f"/api/task1-archive/questions?user_id={test_user['identifier']}"
+    client.get(url)
+    assert f"t1:{test_user['identifier']}" in archive_cache.client.store
+    
+    scoring_service = MagicMock()
+    scoring_service.evaluate_task1_response = AsyncMock(return_value={"overall_score": 4})
+    app.dependency_overrides[get_scoring_service] = lambda: scoring_service
+    try:
+        with patch("routers.scoring.schedule_audio_cleanup"):
+            response = client.post(
+                "/api/scoring/evaluate-task1",
+                json={
+                    "problem_id": test_user["session_ids"][4],
+                    "transcript": "New answer",
+                    "question": "Task1 question 4"
+                }
+            )
+    finally:
+        app.dependency_overrides.pop(get_scoring_service, None)
+    
+    assert response.status_code == 200
+    assert f"t1:{test_user['identifier']}" not in archive_cache.client.store
+    latest = client.get(url).json()["questions"][0]
+    assert latest["user_transcript"] == "New answer"
+    assert latest["overall_score"] == 4
@@ -87,7 +87,9 @@ export async function isAuthenticated(): Promise<boolean> {
   if (!token) return false;
 
   try {
-    const res = await fetch(`${API_BASE}/api/auth/verify?session_token=${encodeURIComponent(token)}`);
+    const res = await fetch(`${API_BASE}/api/auth/verify`, {
+      headers: { Authorization: `Bearer ${token}` },
+    });
     return res.ok;
   } catch (e) {
     console.error('isAuthenticated error', e);